@@ -6,8 +6,15 @@
 
 # Knapsack solver using DFS
 
-from math import ceil
-import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import cmp_to_key
+from heapq import heappop, heappush
+from itertools import accumulate
+from multiprocessing import Queue, Value
+from os import cpu_count
+from queue import Empty
 from sys import argv
 from random import randrange
 
@@ -16,174 +23,564 @@ class Knapsack(object):
 
     # `c` and `n` are given capacity and number of
     # items. The value and weight of each item is chosen
-    # randomly from the range 1..maxv.
+    # randomly from the range 1..maxv. Values and weights
+    # are kept in compact integer arrays.
     def __init__(self, n, c = None, maxv=100):
         if c == None:
-            c = ceil(maxv * n / 4.0)
+            # Round up, in integer arithmetic.
+            c = -(-maxv * n // 4)
         self.c = c
         self.n = n
         def randattr():
-            return [randrange(1, maxv + 1) for _ in range(n)]
+            return array('i', (randrange(1, maxv + 1) for _ in range(n)))
         self.v = randattr()
         self.w = randattr()
+        # Combine the attribute lists once, up front, since
+        # every solver asks for them.
+        self._items = [(i, self.w[i], self.v[i]) for i in range(n)]
 
-    # Combine the attribute list to get a single list of
-    # item attributes.
+    # Return a single list of item attributes. The list is
+    # shared, and should not be modified.
     def items(self):
-        return [(i, self.w[i], self.v[i]) for i in range(self.n)]
-
-# Return a list of all sets of elements drawn
-# from the given input collection `l`.
-def powerset(l):
-    result = [set()]
-    while l:
-        e = l.pop(0)
-        result += [s | {e} for s in result]
-    return result
+        return self._items
 
 # Compute the maximum legal knapsack value for instance `ks`
 # using truly ignorant brute-force.
 def ks_brute_force(ks):
-    # Maximum packing and value found so far.
-    max_t = set()
-    max_val = 0
+    n = ks.n
+    w = tuple(ks.w)
+    v = tuple(ks.v)
+    c = ks.c
 
-    # Compute the sum of all attributes `a` at indices
-    # drawn from the collection `t`.
-    def fsum(a, t):
-        result = 0
-        for e in t:
-            result += a[e]
-        return result
+    # Maximum packing and value found so far. Packings are
+    # integer bitmasks of item indices.
+    max_t = 0
+    max_val = 0
 
-    # Try every possible subset of 1..n.
-    for t in powerset(list(range(ks.n))):
+    # Try every possible subset of 1..n. Walking the subsets
+    # in Gray code order adds or removes exactly one item at
+    # each step, so the weight and value of the current
+    # subset `t` can be kept as running sums.
+    t = 0
+    weight = 0
+    val = 0
+    for g in range(1, 1 << n):
+        # The item to flip is the lowest set bit of `g`.
+        j = (g & -g).bit_length() - 1
+        t ^= 1 << j
+        if t & (1 << j):
+            weight += w[j]
+            val += v[j]
+        else:
+            weight -= w[j]
+            val -= v[j]
         # Check capacity.
-        if fsum(ks.w, t) > ks.c:
+        if weight > c:
             continue
-        # Find value.
-        val = fsum(ks.v, t)
         # Update max value if needed.
         if val > max_val:
             max_val = val
             max_t = t
-    # Return max value.
-    return (max_t, max_val)
+    # Return max packing as a set, and max value.
+    return ({j for j in range(n) if max_t & (1 << j)}, max_val)
 
 # Two possible heuristics: an O(1) one and
-# an O(n) one.
+# an O(log n) one.
 HEURISTIC_FAST = 1
 HEURISTIC_ACCURATE = 2
 
-# Compute the maximum legal knapsack value for instance `ks`
-# using complete search in state space of partial solutions
-# with appropriate heurstics and pruning. If `bb` is `True`,
-# do "branch-and-bound" pruning to speed up search.
-def ks_dfs(ks, bb=None):
-    # XXX By default Python will throw an error after something
-    # like 1000 recursive calls. This makes sure there's enough
-    # stack space to run. Thanks Python.
-    rlimit = sys.getrecursionlimit()
-    if rlimit < 2 * ks.n:
-        sys.setrecursionlimit(2 * ks.n)
-
-    # Maximum packing and value found so far.
-    max_t = set()
+# Return the indices of the items of instance `ks` in order
+# of decreasing value density, together with the item
+# weights and values laid out in that order, so that
+# searches never need to look through the indices.
+def density_order(ks):
+    # Compare densities exactly, by cross-multiplying,
+    # putting the denser item first.
+    def by_density(x, y):
+        _, wx, vx = x
+        _, wy, vy = y
+        return vy * wx - vx * wy
+    S = [i for i, _, _ in sorted(ks.items(), key=cmp_to_key(by_density))]
+    w = tuple(ks.w[j] for j in S)
+    v = tuple(ks.v[j] for j in S)
+    return (S, w, v)
+
+# Translate a packing `t`, given as a bitmask of positions
+# in the density order `S`, back into a set of items.
+def packing_items(S, t):
+    return {S[i] for i in range(len(S)) if t & (1 << i)}
+
+# Number of nodes the search expands between checks of the
+# best value shared by parallel workers.
+SYNC_INTERVAL = 4096
+
+# Largest number of items times capacity for which the
+# search remembers the partial solutions it has seen.
+MEMO_LIMIT = 10 ** 6
+
+# Return the prefix sums of item weights `w` and values
+# `v`, given in order of decreasing value density, so that
+# the fractional fill of any suffix of the items can be
+# found by binary search. These are kept as lists rather
+# than `array`s: indexing an `array` must box each element
+# into a fresh int, which makes the search loops slower.
+def prefix_sums(w, v):
+    W = list(accumulate(w, initial=0))
+    V = list(accumulate(v, initial=0))
+    return (W, V)
+
+# Return the tables `dfs_search()` uses for items with
+# weights `w` and values `v`, given in order of decreasing
+# value density: the prefix sums `W` and `V`, and the
+# dominance bitmasks `dom` described below. These depend
+# only on the items, so are built once per instance.
+def search_tables(w, v):
+    n = len(w)
+    W, V = prefix_sums(w, v)
+
+    # Item `i` dominates a later item `k` if it weighs no
+    # more and is worth no less. A packing with `k` but not
+    # `i` can swap them to do at least as well, so there is
+    # no need to take `k` once `i` has been skipped. `dom[k]`
+    # is the bitmask of the items dominating item `k`, found
+    # by intersecting the bitmasks of items at most as heavy
+    # and at least as valuable.
+    by_weight = dict()
+    by_value = dict()
+    for i in range(n):
+        by_weight[w[i]] = by_weight.get(w[i], 0) | (1 << i)
+        by_value[v[i]] = by_value.get(v[i], 0) | (1 << i)
+    lighter = dict()
+    acc = 0
+    for x in sorted(by_weight):
+        acc |= by_weight[x]
+        lighter[x] = acc
+    richer = dict()
+    acc = 0
+    for x in sorted(by_value, reverse=True):
+        acc |= by_value[x]
+        richer[x] = acc
+    dom = [lighter[w[k]] & richer[v[k]] & ((1 << k) - 1)
+           for k in range(n)]
+
+    return (W, V, dom)
+
+# Search the state space of partial solutions for the best
+# packing into capacity `c` of items with weights `w` and
+# values `v`, given in order of decreasing value density.
+# `bb` is the pruning heuristic, as for `ks_dfs()`. Return
+# the best packing as a bitmask of positions in `w` and
+# `v`, together with its value.
+#
+# By default the whole tree is searched. Otherwise `roots`
+# is a list of partial solutions (stack entries, see below)
+# whose subtrees are to be searched, and `best` is a
+# shared `multiprocessing.Value` holding the best value
+# found by any worker so far, used to tighten pruning.
+# When `best` is checked, `share` (if given) is called with
+# the stack, and may take entries off the bottom of it to
+# hand to other workers. `tables` are from `search_tables()`,
+# and are built here if not given.
+def dfs_search(w, v, c, bb, roots=None, best=None, share=None,
+               tables=None):
+    n = len(w)
+
+    # Check the heuristic once here, so that the search
+    # loop need only tell the two apart.
+    if bb and bb not in (HEURISTIC_FAST, HEURISTIC_ACCURATE):
+        exit("unknown heuristic")
+
+    # Build the tables for the search if not given.
+    if tables is None:
+        tables = search_tables(w, v)
+    W, V, dom = tables
+
+    # Maximum packing and value found so far. Packings are
+    # kept as integer bitmasks, which are much cheaper to
+    # extend than sets. Start from the greedy packing, which
+    # takes each item in turn if it fits.
+    max_t = 0
     max_val = 0
+    weight = 0
+    for i in range(n):
+        if weight + w[i] <= c:
+            weight += w[i]
+            max_val += v[i]
+            max_t |= 1 << i
 
-    # Consider items in order of decreasing value density.
-    def density(x):
-        i, w, v = x
-        return float(v) / float(w)
-    S = [i for i, _, _ in sorted(ks.items(), key=density, reverse=True)]
-    n = len(S)
-    
-    # Insert the next best item into the knapsack, or not.
-    # Update the best solution if needed. `i` is current
-    # item, `T` is set of items added so far, `val` and
-    # `weight` are the running value and weight of `T`.
-    def ks_dfs_step(i, T, val, weight):
+    # The fractional fill of the whole knapsack, rounded
+    # down, bounds the value of every packing. Once some
+    # packing reaches it, the search is done.
+    k = bisect_right(W, c) - 1
+    root_bound = V[k]
+    if k < n:
+        root_bound += (c - W[k]) * v[k] // w[k]
+    if max_val >= root_bound:
+        return (max_t, max_val)
+
+    # Value a partial solution must be able to beat to be
+    # worth searching. This is `max_val`, unless another
+    # worker has found better.
+    limit = max_val
+
+    # Best value of any partial solution seen so far, keyed
+    # by its next item and its weight, if there are few
+    # enough such keys to be worth remembering. A partial
+    # solution that does no better than an earlier one with
+    # the same key is dominated and can be dropped.
+    if n * c <= MEMO_LIMIT:
+        seen = dict()
+    else:
+        seen = None
+
+    # Search all the feasibly optimal solutions and return
+    # the best. Each stack entry is a partial solution: `i`
+    # is current item, `val` and `weight` are the running
+    # value and weight of `T`, the bitmask of items added
+    # so far. Using an explicit stack rather than recursion
+    # avoids Python's call overhead and recursion limit.
+    if roots is None:
+        roots = [(0, 0, 0, 0)]
+    stack = list(reversed(roots))
+    countdown = 0
+    while stack:
+        # Trade best values with the other workers, if any,
+        # every `SYNC_INTERVAL` nodes.
+        if best is not None:
+            countdown -= 1
+            if countdown <= 0:
+                countdown = SYNC_INTERVAL
+                with best.get_lock():
+                    if max_val > best.value:
+                        best.value = max_val
+                    limit = max(limit, best.value)
+                if limit >= root_bound:
+                    break
+                if share is not None:
+                    share(stack)
+        i, val, weight, T = stack.pop()
         # Update best solution if needed.
-        nonlocal max_t, max_val
         if val > max_val:
             max_val = val
             max_t = T
+            if val > limit:
+                limit = val
+            if val >= root_bound:
+                break
         # If there are no more items, we're done.
         if i >= n:
-            return
-        # Find the actual index of the i'th item.
-        j = S[i]
+            continue
         # Implement Branch-and-Bound.
         if bb:
             if bb == HEURISTIC_FAST:
                 # Fast but bad heuristic: assume can fill
                 # rest of basket with most dense remaining
-                # item.
-                rem_weight = ks.c - weight
-                j_density = ks.v[j] / ks.w[j]
-                optimum_rest = ceil(rem_weight * j_density)
-            elif bb == HEURISTIC_ACCURATE:
-                # Slower but better heuristic: assume can use
-                # solution with fractional fill.
-                optimum_rest = 0
-                acc_weight = weight
-                for k in range(i, n):
-                    m = S[k]
-                    if ks.w[m] + acc_weight > ks.c:
-                        rem_weight = ks.c - acc_weight
-                        m_density = ks.v[m] / ks.w[m]
-                        optimum_rest += ceil(rem_weight * m_density)
-                        break
-                    optimum_rest += ks.v[m]
-                    acc_weight += ks.w[m]
+                # item. Values are integers, so the bound
+                # can be rounded down.
+                rem_weight = c - weight
+                optimum_rest = rem_weight * v[i] // w[i]
             else:
-                exit("unknown heuristic")
-            if val + optimum_rest <= max_val:
-                return
+                # Slower but better heuristic: assume can use
+                # solution with fractional fill, rounded down.
+                # Items `i` through `k - 1` fit whole, and item
+                # `k` (if any) is the first that does not.
+                k = bisect_right(W, c - weight + W[i], i) - 1
+                optimum_rest = V[k] - V[i]
+                if k < n:
+                    rem_weight = c - weight - (W[k] - W[i])
+                    optimum_rest += rem_weight * v[k] // w[k]
+            if val + optimum_rest <= limit:
+                continue
+        # Prune if dominated by an earlier partial solution.
+        if seen is not None:
+            key = (i, weight)
+            if seen.get(key, -1) >= val:
+                continue
+            seen[key] = val
+        # Try not adding the new item. This is pushed first
+        # so that it is explored after the branch below.
+        stack.append((i + 1, val, weight, T))
         # Calculate the potential weight with new item.
-        new_weight = weight + ks.w[j]
-        # If there's room, try adding the new item.
-        if new_weight <= ks.c:
-            ks_dfs_step(i + 1, T | {j}, val + ks.v[j], new_weight)
-        # Try not adding the new item.
-        ks_dfs_step(i + 1, T, val, weight)
+        new_weight = weight + w[i]
+        # If there's room, and no item dominating the new
+        # item has been skipped, try adding the new item.
+        if new_weight <= c and dom[i] & T == dom[i]:
+            stack.append((i + 1, val + v[i], new_weight, T | (1 << i)))
 
-    # Search all the feasibly optimal solutions and return
-    # the best.
-    ks_dfs_step(0, set(), 0, 0)
+    return (max_t, max_val)
+
+# Compute the maximum legal knapsack value for instance `ks`
+# using complete search in state space of partial solutions
+# with appropriate heurstics and pruning. If `bb` is `True`,
+# do "branch-and-bound" pruning to speed up search.
+def ks_dfs(ks, bb=None):
+    # Consider items in order of decreasing value density.
+    S, w, v = density_order(ks)
+    max_t, max_val = dfs_search(w, v, ks.c, bb)
+    return (packing_items(S, max_t), max_val)
+
+# State shared by the worker processes of a parallel
+# search, set up once per process by `dfs_worker_init()`:
+# the arguments for `dfs_search()`, the queue of subtrees
+# waiting to be searched, the count of subtrees queued or
+# being searched, and the count of workers waiting for
+# work.
+dfs_worker_state = None
+
+def dfs_worker_init(w, v, c, bb, best, work, pending, idle):
+    global dfs_worker_state
+    tables = search_tables(w, v)
+    dfs_worker_state = (w, v, c, bb, tables, best, work, pending, idle)
+
+# If some worker is waiting for work, hand it the bottom
+# entry of the search `stack`. This is the partial solution
+# nearest the root, so it has the largest subtree left.
+def dfs_worker_share(stack):
+    _, _, _, _, _, _, work, pending, idle = dfs_worker_state
+    if idle.value > 0 and len(stack) > 1:
+        with pending.get_lock():
+            pending.value += 1
+        work.put(stack.pop(0))
+
+# Search subtrees from the work queue in a parallel search
+# worker process, until no subtrees are left queued or
+# being searched anywhere. Return the best packing found.
+def dfs_worker():
+    w, v, c, bb, tables, best, work, pending, idle = dfs_worker_state
+    max_t = 0
+    max_val = 0
+    while True:
+        # Wait for work.
+        with idle.get_lock():
+            idle.value += 1
+        root = None
+        while root is None and pending.value > 0:
+            try:
+                root = work.get(timeout=0.01)
+            except Empty:
+                pass
+        with idle.get_lock():
+            idle.value -= 1
+        if root is None:
+            return (max_t, max_val)
+
+        # Search the subtree, sharing parts of it with idle
+        # workers along the way.
+        t, val = dfs_search(w, v, c, bb, roots=[root], best=best,
+                            share=dfs_worker_share, tables=tables)
+        if val > max_val:
+            max_t = t
+            max_val = val
+        with pending.get_lock():
+            pending.value -= 1
+
+# Compute the maximum legal knapsack value for instance `ks`
+# as with `ks_dfs()`, but splitting the search tree across
+# `workers` processes (by default, one per CPU). The workers
+# share the best value found so far to tighten pruning, and
+# a worker that runs out of work gets part of another's.
+def ks_dfs_parallel(ks, bb=None, workers=None):
+    # Consider items in order of decreasing value density.
+    S, w, v = density_order(ks)
+    n = len(S)
+    c = ks.c
+    if workers is None:
+        workers = cpu_count() or 1
+
+    # Split the search tree into the feasible partial
+    # solutions at a depth giving several subtrees per
+    # worker, so that an idle worker can pick up another.
+    # The subtrees are listed in the order `ks_dfs()` would
+    # search them.
+    depth = min(n, (8 * workers - 1).bit_length())
+    roots = [(0, 0, 0, 0)]
+    for i in range(depth):
+        next_roots = []
+        for _, val, weight, T in roots:
+            new_weight = weight + w[i]
+            if new_weight <= c:
+                next_roots.append((i + 1, val + v[i], new_weight,
+                                   T | (1 << i)))
+            next_roots.append((i + 1, val, weight, T))
+        roots = next_roots
+
+    # Queue the subtrees, search them, and keep the best
+    # result.
+    best = Value('q', 0)
+    work = Queue()
+    for root in roots:
+        work.put(root)
+    pending = Value('i', len(roots))
+    idle = Value('i', 0)
+    initargs = (w, v, c, bb, best, work, pending, idle)
+    with ProcessPoolExecutor(workers,
+                             initializer=dfs_worker_init,
+                             initargs=initargs) as executor:
+        searches = [executor.submit(dfs_worker) for _ in range(workers)]
+        results = [search.result() for search in searches]
+    max_t, max_val = max(results, key=lambda r: r[1])
+    return (packing_items(S, max_t), max_val)
+
+# Compute the maximum legal knapsack value for instance `ks`
+# using best-first branch-and-bound: always expand the
+# partial solution with the highest fractional-fill bound,
+# so that good packings are found early and prune hard.
+def ks_best_first(ks):
+    # Consider items in order of decreasing value density.
+    S, w, v = density_order(ks)
+    n = len(S)
+    c = ks.c
+    W, V = prefix_sums(w, v)
+
+    # Bound on the value that can be added to a partial
+    # solution of weight `weight` using items `i` onward,
+    # from the fractional fill as in `HEURISTIC_ACCURATE`.
+    def bound(i, weight):
+        k = bisect_right(W, c - weight + W[i], i) - 1
+        optimum_rest = V[k] - V[i]
+        if k < n:
+            rem_weight = c - weight - (W[k] - W[i])
+            optimum_rest += rem_weight * v[k] // w[k]
+        return optimum_rest
+
+    # Maximum packing and value found so far, with packings
+    # as bitmasks of positions in `S`.
+    max_t = 0
+    max_val = 0
+
+    # Best value of any partial solution queued so far,
+    # keyed by its next item and its weight. A partial
+    # solution that does no better than an earlier one with
+    # the same key is dominated and can be dropped.
+    seen = dict()
+
+    # Priority queue of partial solutions, keyed by negated
+    # bound so that the most promising comes out first. The
+    # count breaks ties in first-come order and keeps
+    # `heapq` from comparing the rest of the entry.
+    count = 0
+    queue = [(-bound(0, 0), count, 0, 0, 0, 0)]
+    while queue:
+        neg_bound, _, i, val, weight, T = heappop(queue)
+        # If even the most promising partial solution can't
+        # beat the best so far, nothing can.
+        if -neg_bound <= max_val:
+            break
+        # Try adding item `i` if there's room, and try not
+        # adding it.
+        children = [(val, weight, T)]
+        new_weight = weight + w[i]
+        if new_weight <= c:
+            children.append((val + v[i], new_weight, T | (1 << i)))
+        for child_val, child_weight, child_T in children:
+            # Update best solution if needed.
+            if child_val > max_val:
+                max_val = child_val
+                max_t = child_T
+            # If there are no more items, this one is done.
+            if i + 1 >= n:
+                continue
+            # Prune by bound and by dominance.
+            child_bound = child_val + bound(i + 1, child_weight)
+            if child_bound <= max_val:
+                continue
+            key = (i + 1, child_weight)
+            if seen.get(key, -1) >= child_val:
+                continue
+            seen[key] = child_val
+            count += 1
+            heappush(queue, (-child_bound, count,
+                             i + 1, child_val, child_weight, child_T))
+
+    return (packing_items(S, max_t), max_val)
+
+# Compute the maximum legal knapsack value for instance `ks`
+# by dynamic programming over capacities, in time and space
+# O(n c). This beats search when the capacity is small.
+def ks_dp(ks):
+    c = ks.c
+
+    # `best[x]` is the best value of any packing of the
+    # items so far into capacity `x`. `rows[j]` is `best`
+    # from before item `j` was considered, kept to recover
+    # the packing.
+    best = [0] * (c + 1)
+    rows = []
+    for w_j, v_j in zip(ks.w, ks.v):
+        rows.append(best)
+        # At each capacity with room, either leave the item
+        # out or add it to the best packing of the capacity
+        # left over. Whole rows are built at once to keep
+        # the per-capacity work out of the interpreter.
+        if w_j <= c:
+            taken = [x + v_j for x in best[:c + 1 - w_j]]
+            best = best[:w_j] + list(map(max, best[w_j:], taken))
+
+    # Walk back through the rows: an item was taken where
+    # considering it improved the best value.
+    max_val = best[c]
+    max_t = set()
+    x = c
+    for j in reversed(range(ks.n)):
+        if rows[j][x] != best[x]:
+            max_t.add(j)
+            x -= ks.w[j]
+        best = rows[j]
     return (max_t, max_val)
 
 # Do a thing with the code above.
-if argv[1] == "test":
-    for _ in range(1000):
-        ks = Knapsack(10)
-        sbf, wbf = ks_brute_force(ks)
-        for name, h in (("none", None),
-                        ("fast", HEURISTIC_FAST),
-                        ("accurate", HEURISTIC_ACCURATE)):
-            sdfs, wdfs = ks_dfs(ks, bb=h)
-            if wbf != wdfs:
-                print(wbf, name, wdfs, ks.items())
-elif argv[1] == "time":
-    if argv[2] == "bf":
-        ks = Knapsack(18)
-        print(ks.n, ks_brute_force(ks))
-    elif argv[2].startswith("dfs"):
-        hs = argv[2].split("-")
-        if len(hs) == 1:
-            bb = None
-            n = 20
-        elif hs[1] == "hfast":
-            bb = HEURISTIC_FAST
-            n = 45
-        elif hs[1] == "haccurate":
-            bb = HEURISTIC_ACCURATE
-            n = 3000
+if __name__ == "__main__":
+    if argv[1] == "test":
+        for t in range(1000):
+            ks = Knapsack(10)
+            sbf, wbf = ks_brute_force(ks)
+            for name, h in (("none", None),
+                            ("fast", HEURISTIC_FAST),
+                            ("accurate", HEURISTIC_ACCURATE)):
+                sdfs, wdfs = ks_dfs(ks, bb=h)
+                if wbf != wdfs:
+                    print(wbf, name, wdfs, ks.items())
+                # Starting worker processes is slow, so only
+                # check the parallel search now and then.
+                if t % 50 == 0:
+                    spar, wpar = ks_dfs_parallel(ks, bb=h, workers=2)
+                    if wbf != wpar:
+                        print(wbf, "parallel", name, wpar, ks.items())
+            sbest, wbest = ks_best_first(ks)
+            if wbf != wbest:
+                print(wbf, "best-first", wbest, ks.items())
+            sdp, wdp = ks_dp(ks)
+            if wbf != wdp:
+                print(wbf, "dp", wdp, ks.items())
+    elif argv[1] == "time":
+        if argv[2] == "bf":
+            ks = Knapsack(18)
+            print(ks.n, ks_brute_force(ks))
+        elif argv[2] == "best":
+            ks = Knapsack(3000)
+            print(ks.n, ks_best_first(ks))
+        elif argv[2] == "dp":
+            ks = Knapsack(300)
+            print(ks.n, ks_dp(ks))
+        elif argv[2].startswith("dfs") or argv[2].startswith("pdfs"):
+            hs = argv[2].split("-")
+            if len(hs) == 1:
+                bb = None
+                n = 20
+            elif hs[1] == "hfast":
+                bb = HEURISTIC_FAST
+                n = 45
+            elif hs[1] == "haccurate":
+                bb = HEURISTIC_ACCURATE
+                n = 3000
+            else:
+                exit("unknown heuristic")
+            ks = Knapsack(n)
+            if hs[0] == "pdfs":
+                print(ks.n, ks_dfs_parallel(ks, bb=bb))
+            else:
+                print(ks.n, ks_dfs(ks, bb=bb))
         else:
-            exit("unknown heuristic")
-        ks = Knapsack(n)
-        print(ks.n, ks_dfs(ks, bb=bb))
+            exit("unknown timer", argv[2])
     else:
-        exit("unknown timer", argv[2])
-else:
-    exit("unknown action", argv[1])
+        exit("unknown action", argv[1])